@@ -8,6 +8,7 @@ class CartAdmin(admin.ModelAdmin):
     list_filter = ('created_at', 'updated_at', 'user')
     search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('user', 'created_at', 'updated_at')
+    list_select_related = ('user',)
     
     # Prevent adding or deleting carts via the admin
     def has_add_permission(self, request):
@@ -39,6 +40,7 @@ class CartItemAdmin(admin.ModelAdmin):
     readonly_fields = ('cart', 'product', 'selected_price_weight', 'quantity', 'total_price')
     search_fields = ('product__name', 'cart__user__username', 'cart__user__email')
     list_filter = ('product',)
+    list_select_related = ('cart__user', 'product', 'selected_price_weight')
 
     # Prevent adding, changing, or deleting cart items via the admin
     def has_add_permission(self, request):
@@ -9,6 +9,7 @@ from .serializers import CartSerializer
 from products.models import Product, PriceWeight
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from django.db.models import F
 
 class CartViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
@@ -82,21 +83,20 @@ class CartViewSet(viewsets.ViewSet):
                 'error': 'Insufficient stock available.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        cart_item, created = CartItem.objects.get_or_create(
-            cart=cart,
-            product=product,
-            selected_price_weight=price_weight
-        )
-        if not created:
-            cart_item.quantity += quantity
-        else:
-            cart_item.quantity = quantity
-
         try:
-            cart_item.save()
+            cart_item, created = CartItem.objects.get_or_create(
+                cart=cart,
+                product=product,
+                selected_price_weight=price_weight,
+                defaults={'quantity': quantity}
+            )
         except ValidationError as e:
             return Response({'error': e.message_dict}, status=status.HTTP_400_BAD_REQUEST)
 
+        if not created:
+            # Increment in the database so concurrent adds don't lose updates
+            CartItem.objects.filter(pk=cart_item.pk).update(quantity=F('quantity') + quantity)
+
         return Response({'status': 'Added to cart'}, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['put'])
@@ -96,7 +96,29 @@ class CartAPITestCase(TestCase):
         cart_item = cart.items.first()
         self.assertEqual(cart_item.quantity, 2)
         self.assertEqual(cart_item.selected_price_weight, self.price_weight)
-    
+
+    def test_add_to_cart_existing_item_increments_quantity(self):
+        """
+        Test adding the same product and price-weight twice increments the existing item.
+        """
+        url = reverse('cart-add-to-cart')
+        data = {
+            "product_id": self.product.id,
+            "quantity": 2,
+            "price_weight": {
+                "price": "599.99",
+                "weight": "200g"
+            }
+        }
+        self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # Verify in database
+        cart = Cart.objects.get(user=self.user)
+        self.assertEqual(cart.items.count(), 1)
+        self.assertEqual(cart.items.first().quantity, 4)
+
     def test_add_to_cart_insufficient_stock(self):
         """
         Test adding a product to the cart with quantity exceeding inventory.
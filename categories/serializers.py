@@ -11,8 +11,8 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'tags', 'image', 'secondary_image', 'secondary_description'] 
 
     def get_tags(self, obj):
-        # Return a list of tag names
-        return list(obj.tags.names())
+        # Return a list of tag names; iterating all() reuses prefetched tags
+        return [tag.name for tag in obj.tags.all()]
 
 
     def validate_name(self, value):
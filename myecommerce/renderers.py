@@ -0,0 +1,27 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON using orjson instead of the stdlib json module.
+
+    Output matches JSONRenderer byte for byte, except that NaN and infinite floats
+    render as null; orjson has no strict mode, so STRICT_JSON doesn't raise for them.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        # Pretty printed output (e.g. for the browsable API) keeps the stdlib path
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Types orjson doesn't handle natively (Decimal, lazy strings, datetimes)
+        # fall back to DRF's encoder so the output matches JSONRenderer
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+
+        # Keep escaping \u2028 and \u2029 like JSONRenderer does
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
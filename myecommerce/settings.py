@@ -67,6 +67,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'taggit',
     'users',
     'categories',
@@ -101,11 +102,20 @@ SIMPLE_JWT = {
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'myecommerce.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'myecommerce.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
         'rest_framework.throttling.UserRateThrottle'
@@ -191,7 +201,6 @@ TEMPLATES = [
         },
     },
 ]
-print("templates_base dir =", TEMPLATES)
 WSGI_APPLICATION = 'myecommerce.wsgi.application'
 
 SITE_ID = 1
@@ -272,6 +281,24 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# Rate-limit counters live in the default cache, so point it at Redis in
+# production to share them across gunicorn workers.
+REDIS_URL = config('REDIS_URL', default=None)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
+RATELIMIT_USE_CACHE = 'default'
+
+# Cache the user behind each JWT (users.authentication.CachedJWTAuthentication) only when
+# the cache is shared, so evicting a changed user reaches every worker
+CACHE_JWT_USER = bool(REDIS_URL)
+
 # Add a flag to indicate testing mode
 TESTING = 'test' in sys.argv
 if 'test' in sys.argv or sys.argv[1] == 'test':
@@ -0,0 +1,74 @@
+import datetime
+import uuid
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def assertRendersLikeJSONRenderer(self, data, accepted_media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type)
+        )
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_plain_data(self):
+        self.assertRendersLikeJSONRenderer({'name': 'Garam Masala', 'tags': ['blend'], 'count': 2, 'price': 1.5, 'active': True, 'image': None})
+
+    def test_non_string_keys(self):
+        self.assertRendersLikeJSONRenderer({1: 'one', 2: 'two'})
+
+    def test_decimal(self):
+        self.assertRendersLikeJSONRenderer({'price': Decimal('599.99')})
+
+    def test_datetimes(self):
+        self.assertRendersLikeJSONRenderer({
+            'created_at': datetime.datetime(2024, 7, 1, 10, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'naive': datetime.datetime(2024, 7, 1, 10, 30),
+            'birthdate': datetime.date(1990, 1, 1),
+            'time': datetime.time(10, 30, 15, 250000),
+            'duration': datetime.timedelta(minutes=15),
+        })
+
+    def test_uuid_and_lazy_strings(self):
+        self.assertRendersLikeJSONRenderer({'id': uuid.UUID(int=1), 'message': gettext_lazy('This field is required.')})
+
+    def test_unicode_and_line_separators(self):
+        self.assertRendersLikeJSONRenderer({'name': 'Haldi \u2013 \u0939\u0932\u094d\u0926\u0940 line\u2028para\u2029end'})
+
+    def test_indented_output(self):
+        self.assertRendersLikeJSONRenderer({'name': 'Garam Masala'}, 'application/json; indent=4')
+
+    def test_nan_renders_as_null(self):
+        # Unlike JSONRenderer under STRICT_JSON, orjson doesn't raise for out of range floats
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({'value': float('nan')})
+        self.assertEqual(ORJSONRenderer().render({'value': float('nan')}), b'{"value":null}')
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, parser, content):
+        return parser.parse(BytesIO(content))
+
+    def test_parses_like_json_parser(self):
+        content = '{"login": "testuser", "addresses": [{"id": 1, "city": "Pune"}], "price": 1.5, "name": "हल्दी"}'.encode()
+        self.assertEqual(self.parse(ORJSONParser(), content), self.parse(JSONParser(), content))
+
+    def test_parse_error(self):
+        with self.assertRaisesMessage(ParseError, 'JSON parse error'):
+            self.parse(ORJSONParser(), b'{"login": ')
+
+    def test_empty_body_is_parse_error(self):
+        with self.assertRaises(ParseError):
+            self.parse(ORJSONParser(), b'')
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Cast, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from categories.models import Category
 from taggit.managers import TaggableManager
 import re
@@ -42,6 +44,14 @@ class Product(models.Model):
     tags = TaggableManager()
     is_active = models.BooleanField(default=True, help_text="Uncheck this box to deactivate the product.")
 
+    class Meta:
+        # Trigram indexes over the exact UPPER(col::text) expression Django emits for
+        # icontains on PostgreSQL, so unified search can use an index for '%q%' lookups
+        indexes = [
+            GinIndex(OpClass(Upper(Cast('name', models.TextField())), name='gin_trgm_ops'), name='product_name_trgm_idx'),
+            GinIndex(OpClass(Upper(Cast('description', models.TextField())), name='gin_trgm_ops'), name='product_desc_trgm_idx'),
+        ]
+
     def update_availability(self):
         in_stock = self.price_weights.filter(inventory__gt=0).exists()
         if self.is_active != in_stock:
@@ -48,8 +48,8 @@ class ProductSerializer(TaggitSerializer, serializers.ModelSerializer):
         depth = 1
 
     def get_status(self, obj):
-        # Check if any of the price_weight options are in stock
-        in_stock = obj.price_weights.filter(inventory__gt=0).exists()
+        # Check if any of the price_weight options are in stock, reading prefetched rows when present
+        in_stock = any(price_weight.inventory > 0 for price_weight in obj.price_weights.all())
         return "In stock" if in_stock and obj.is_active else "Out of stock"
 
     def create(self, validated_data):
@@ -57,7 +57,6 @@ class ProductSerializer(TaggitSerializer, serializers.ModelSerializer):
             category = validated_data.pop('category')
 
             product = Product.objects.create(category=category, **validated_data)
-            print(f"Created product: {product}")  # Debug log
             # Create price-weight combinations
             for combo_data in price_weights_data:
                 PriceWeight.objects.create(product=product, **combo_data)
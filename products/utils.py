@@ -1,13 +1,12 @@
 import pandas as pd
-from io import StringIO
 from rest_framework.exceptions import ValidationError
 from .models import Product, Category, PriceWeight
 
 def bulk_upload_products(file):
     # Determine file type and read data accordingly
     if file.name.endswith('.csv'):
-        data_set = file.read().decode('UTF-8')
-        data = pd.read_csv(StringIO(data_set))
+        # Let pandas read straight from the upload instead of copying it into a string first
+        data = pd.read_csv(file, encoding='UTF-8')
     elif file.name.endswith(('.xls', '.xlsx')):
         data = pd.read_excel(file)
     else:
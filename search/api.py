@@ -6,44 +6,58 @@ from products.models import Product
 from categories.models import Category
 from products.serializers import ProductSerializer
 from categories.serializers import CategorySerializer
-from django.db.models import Q
+from django.db.models import Count, Q
+
+
+def get_suggestions(query, names, n=3, cutoff=0.6):
+    # Cheap prefix and substring matches first, fuzzy matching only as a fallback
+    lowered_query = query.lower()
+    lowered_names = [name.lower() for name in names]
+
+    prefix_matches = [name for name, lowered in zip(names, lowered_names) if lowered.startswith(lowered_query)]
+    if prefix_matches:
+        return prefix_matches[:n]
+
+    substring_matches = [name for name, lowered in zip(names, lowered_names) if lowered_query in lowered]
+    if substring_matches:
+        return substring_matches[:n]
+
+    return difflib.get_close_matches(query, names, n=n, cutoff=cutoff)
+
+
+def product_search_filter(query):
+    # Match tags through a subquery instead of joining the tag table, so the
+    # outer query yields each product once without needing DISTINCT
+    tagged_products = Product.objects.filter(tags__name__icontains=query).values('pk')
+    return Q(name__icontains=query) | Q(description__icontains=query) | Q(pk__in=tagged_products)
+
 
 class UnifiedSearchAPIView(APIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get(self, request, *args, **kwargs):
-        query = request.GET.get('q', '').strip()
+        # Collapse runs of whitespace so 'garam  masala ' matches like 'garam masala'
+        query = ' '.join(request.GET.get('q', '').split())
         if not query:
             return Response({"error": "Search query not provided."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Search for products matching name, description, or tags
         products = Product.objects.filter(
-            Q(name__icontains=query) | Q(tags__name__icontains=query) | Q(description__icontains=query)
-        ).distinct()
-        product_data = ProductSerializer(products, many=True).data
+            product_search_filter(query)
+        ).select_related('category').prefetch_related('tags', 'price_weights', 'images')
 
         # Search for categories based on the query
         categories = Category.objects.filter(
             Q(name__icontains=query) | Q(description__icontains=query)
-        ).distinct()
-        category_data = CategorySerializer(categories, many=True).data
-
-        # For each category, calculate the product count based on the query
-        for category in category_data:
-            product_count = Product.objects.filter(
-                Q(name__icontains=query) | Q(tags__name__icontains=query) | Q(description__icontains=query),
-                category__id=category['id']
-            ).count()
-            category['product_count'] = product_count
-            category['products'] = []  # Ensure no products are returned inside categories
+        ).prefetch_related('tags')
 
         # Generate fuzzy suggestions if no exact matches
         all_product_names = list(Product.objects.values_list('name', flat=True))
         all_category_names = list(Category.objects.values_list('name', flat=True))
-        product_suggestions = difflib.get_close_matches(query, all_product_names, n=3, cutoff=0.6)
-        category_suggestions = difflib.get_close_matches(query, all_category_names, n=3, cutoff=0.6)
+        product_suggestions = get_suggestions(query, all_product_names)
+        category_suggestions = get_suggestions(query, all_category_names)
 
-        # If there are no exact matches, return only suggestions
+        # If there are no exact matches, return only suggestions before doing any serialization work
         if not products and not categories:
             if product_suggestions or category_suggestions:
                 return Response({
@@ -54,6 +68,21 @@ class UnifiedSearchAPIView(APIView):
 
             return Response({"message": "No matches found."}, status=status.HTTP_404_NOT_FOUND)
 
+        # The emptiness checks above populated the result caches, so serializing reuses the fetched rows
+        product_data = ProductSerializer(products, many=True).data
+        category_data = CategorySerializer(categories, many=True).data
+
+        # Count the matching products of every matched category in one grouped query
+        product_counts = dict(
+            Product.objects.filter(
+                product_search_filter(query),
+                category__in=[category['id'] for category in category_data]
+            ).values('category').annotate(count=Count('pk')).values_list('category', 'count')
+        )
+        for category in category_data:
+            category['product_count'] = product_counts.get(category['id'], 0)
+            category['products'] = []  # Ensure no products are returned inside categories
+
         # If exact matches exist but you still want to show fuzzy suggestions
         return Response({
             "products": product_data,
@@ -1,3 +1,112 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from categories.models import Category
+from products.models import Product
+from .api import get_suggestions
+
+
+class SuggestionTests(SimpleTestCase):
+    def setUp(self):
+        self.names = ['Garam Masala', 'Chaat Masala', 'Turmeric Powder', 'Red Chilli Powder']
+
+    def test_prefix_matches_come_first(self):
+        self.assertEqual(get_suggestions('gar', self.names), ['Garam Masala'])
+
+    def test_substring_matches_when_no_prefix(self):
+        self.assertEqual(get_suggestions('masala', self.names), ['Garam Masala', 'Chaat Masala'])
+
+    def test_fuzzy_fallback_for_typos(self):
+        self.assertEqual(get_suggestions('Turmeric Powdr', self.names), ['Turmeric Powder'])
+
+    def test_fuzzy_fallback_for_transposition_typos(self):
+        self.assertEqual(get_suggestions('Tae', ['Tea', 'Salt']), ['Tea'])
+        self.assertEqual(get_suggestions('Rcie', ['Rice', 'Salt']), ['Rice'])
+        self.assertEqual(get_suggestions('Tae', ['Tea', 'Tarte']), ['Tarte', 'Tea'])
+
+    def test_no_suggestions(self):
+        self.assertEqual(get_suggestions('xyz', self.names), [])
+
+
+class UnifiedSearchAPITests(APITestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Spices', description='Whole and ground spices')
+        self.product = Product.objects.create(name='Garam Masala', description='Blend of spices', category=self.category)
+        self.product.tags.add('blend')
+        self.url = reverse('unified_search')
+
+    def test_search_returns_matching_products_and_categories(self):
+        response = self.client.get(self.url, {'q': 'spices'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p['name'] for p in response.data['products']], ['Garam Masala'])
+        self.assertEqual(response.data['categories'][0]['name'], 'Spices')
+        self.assertEqual(response.data['categories'][0]['product_count'], 1)
+
+    def test_search_matches_tags(self):
+        response = self.client.get(self.url, {'q': 'blend'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['products']), 1)
+
+    def test_search_counts_product_with_several_matching_tags_once(self):
+        self.product.tags.add('blended', 'blend-mix')
+        response = self.client.get(self.url, {'q': 'blend'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['products']), 1)
+
+        self.category.description = 'Spice blends'
+        self.category.save()
+        response = self.client.get(self.url, {'q': 'blend'})
+        self.assertEqual(response.data['categories'][0]['product_count'], 1)
+
+    def test_search_collapses_whitespace_in_query(self):
+        response = self.client.get(self.url, {'q': '  garam   masala '})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p['name'] for p in response.data['products']], ['Garam Masala'])
+
+    def test_search_counts_products_per_category(self):
+        herbs = Category.objects.create(name='Dried Herbs', description='Dried leaves')
+        Product.objects.create(name='Dried Mint', description='Mint leaves', category=herbs)
+        Product.objects.create(name='Dried Basil', description='Basil leaves', category=herbs)
+        Category.objects.create(name='Dried Fruit', description='Sun dried')
+
+        response = self.client.get(self.url, {'q': 'dried'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {category['name']: category['product_count'] for category in response.data['categories']}
+        self.assertEqual(counts, {'Dried Herbs': 2, 'Dried Fruit': 0})
+
+    def test_search_query_count_does_not_grow_with_results(self):
+        def add_match(i):
+            category = Category.objects.create(name=f'Spices {i}', description='More spices')
+            category.tags.add('ground', 'whole')
+            product = Product.objects.create(name=f'Spice Mix {i}', description='Blend of spices', category=category)
+            product.tags.add('blend', 'mix')
+            product.price_weights.create(price='100.00', weight='100gms', inventory=i)
+            product.price_weights.create(price='180.00', weight='200gms', inventory=0)
+
+        add_match(1)
+        with self.assertNumQueries(9):
+            response = self.client.get(self.url, {'q': 'spices'})
+        self.assertEqual(len(response.data['products']), 2)
+
+        for i in range(2, 6):
+            add_match(i)
+        with self.assertNumQueries(9):
+            response = self.client.get(self.url, {'q': 'spices'})
+        self.assertEqual(len(response.data['products']), 6)
+        self.assertEqual(sorted(response.data['categories'][1]['tags']), ['ground', 'whole'])
+
+    def test_search_suggests_on_typo(self):
+        response = self.client.get(self.url, {'q': 'Garam Msala'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['product_suggestions'], ['Garam Masala'])
+        self.assertNotIn('products', response.data)
+
+    def test_search_no_matches(self):
+        response = self.client.get(self.url, {'q': 'xyz'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_search_requires_query(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
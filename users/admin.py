@@ -10,6 +10,9 @@ class AddressInline(admin.StackedInline):
 
 class CustomUserAdmin(UserAdmin):
     inlines = (AddressInline,)
+    list_per_page = 50
+    # Skip the unfiltered COUNT(*) over the whole user table on filtered changelists
+    show_full_result_count = False
 
 admin.site.register(CustomUser, CustomUserAdmin)
 admin.site.register(Address)
@@ -1,11 +1,15 @@
 import logging
+import re
+from functools import lru_cache, partial
 from django_ratelimit.decorators import ratelimit
-from django.contrib.auth import get_user_model, authenticate
-from django.db.models import Q
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.utils.crypto import get_random_string
 from rest_framework import status, views
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from users.models import Address
+from .authentication import user_cache_key
 from .serializers import UserSerializer, AddressSerializer
 from django.db import IntegrityError, transaction
 from django.utils.timezone import now
@@ -13,40 +17,30 @@ from django.utils.decorators import method_decorator
 from rest_framework.permissions import AllowAny
 from rest_framework.permissions import IsAuthenticated
 from django.conf import settings
-from django.utils.decorators import method_decorator
+from django.core.cache import cache
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from rest_framework.views import APIView
-from django.urls import reverse_lazy
-from django.contrib.auth.forms import SetPasswordForm
-from django.contrib.auth.tokens import default_token_generator
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
 from django.utils.encoding import force_bytes, force_str
-from rest_framework.response import Response
-from .tokens import custom_token_generator
 from rest_framework import generics
 from .tokens import email_verification_token, custom_token_generator
-from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.urls import reverse
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.core.mail import EmailMultiAlternatives
-from functools import wraps
+from .decorators import login_ratelimit_key, maybe_ratelimit
 
-# Custom decorator that bypasses ratelimiting for tests
 
+User = get_user_model()
 
-def maybe_ratelimit(*args, **kwargs):
-    def decorator(func):
-        if getattr(settings, 'ENABLE_RATE_LIMIT', True):
-            return ratelimit(*args, **kwargs)(func)
-        else:
-            @wraps(func)
-            def wrapped(request, *args, **kwargs):
-                return func(request, *args, **kwargs)
-            return wrapped
-    return decorator
+# Logins shaped like a phone number are looked up by phone_number first
+PHONE_LOGIN_RE = re.compile(r'^\+91\d{10}$')
 
 
-User = get_user_model()
+@lru_cache(maxsize=1)
+def dummy_password_hash():
+    # Built on first use so importing the module doesn't run the password hasher
+    return make_password(get_random_string(32))
 
 
 class UserRegisterAPIView(views.APIView):
@@ -54,19 +48,25 @@ class UserRegisterAPIView(views.APIView):
 
     @method_decorator(maybe_ratelimit(key='ip', rate='5/m', method='POST'))
     def post(self, request):
-        with transaction.atomic():
-            serializer = UserSerializer(data=request.data)
-            if serializer.is_valid():
-                try:
-                    user = serializer.save()
-                    self.send_verification_email(user)
-                    return Response(serializer.data, status=status.HTTP_201_CREATED)
-                except IntegrityError as e:
-                    # Enhanced error handling for a better user experience
-                    if 'phone_number' in str(e):
-                        return Response({"error": "Registration failed, possibly due to duplicate information."}, status=status.HTTP_409_CONFLICT)
-                    return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        # Validate before opening a transaction so rejected signups never BEGIN
+        serializer = UserSerializer(data=request.data)
+        if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            with transaction.atomic():
+                user = serializer.save()
+                # Send once the user is committed, so SMTP latency isn't spent holding the
+                # transaction open. A mail failure is logged instead of failing the signup.
+                transaction.on_commit(partial(self.send_verification_email, user), robust=True)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        except IntegrityError as e:
+            # Only reached when a concurrent signup slips past the UniqueValidators.
+            # Read the violated constraint from psycopg's diagnostics rather than
+            # the rendered message, and never echo SQL back to the client.
+            constraint = getattr(getattr(e.__cause__, 'diag', None), 'constraint_name', None) or ''
+            if 'phone_number' in constraint:
+                return Response({"error": "A user with this phone number already exists."}, status=status.HTTP_409_CONFLICT)
+            return Response({"error": "Registration failed, possibly due to duplicate information."}, status=status.HTTP_409_CONFLICT)
     
 
     def send_verification_email(self, user):
@@ -75,15 +75,6 @@ class UserRegisterAPIView(views.APIView):
         verification_url = reverse('email-verify', kwargs={'uidb64': uid, 'token': token})
         verification_link = f"http://127.0.0.1:8000{verification_url}"
 
-        # Check if template is found
-        from django.template.loader import get_template, TemplateDoesNotExist
-
-        try:
-            template = get_template('email_verification.html')
-            print("Template found")
-        except TemplateDoesNotExist:
-            print("Template not found")
-
         html_content = render_to_string('email_verification.html', {'user': user, 'verification_link': verification_link})
 
         email = EmailMultiAlternatives(
@@ -98,15 +89,26 @@ class UserRegisterAPIView(views.APIView):
 class UserLoginAPIView(views.APIView):
     permission_classes = [AllowAny]  # Allow unregistered users to access this view
 
+    @method_decorator(maybe_ratelimit(key=login_ratelimit_key, rate='5/m', method='POST'))
     @method_decorator(ratelimit(key='ip', rate='10/m'))
     def post(self, request):
         login = request.data.get('login')
         password = request.data.get('password')
-        user = User.objects.filter(Q(username=login) | Q(phone_number=login)).first()
-        if user and user.check_password(password):
+        # Only the columns needed to check the password and issue tokens. Look up
+        # one indexed column at a time rather than OR-ing username and phone_number.
+        users = User.objects.only('id', 'password')
+        user = None
+        if isinstance(login, str) and PHONE_LOGIN_RE.match(login):
+            user = users.filter(phone_number=login).first()
+        if user is None:
+            user = users.filter(username=login).first()
+        if user is None:
+            # Check against a dummy hash so a missing user takes as long as a wrong
+            # password; check_password rejects non-string input like the user branch
+            check_password(password, dummy_password_hash())
+        elif user.check_password(password):
              # Update last_login on successful login
-            user.last_login = now()
-            user.save(update_fields=['last_login'])
+            User.objects.filter(pk=user.pk).update(last_login=now())
              # Generate JWT tokens
             refresh = RefreshToken.for_user(user)
             return Response({
@@ -127,6 +129,7 @@ class LogoutAPIView(views.APIView):
             token = RefreshToken(refresh_token)
             # Attempt to blacklist the given token
             token.blacklist()
+            cache.delete(user_cache_key(request.user.pk))
             # Optionally, invalidate all tokens for this user by updating a user-specific field (not shown here)
             return Response({"success": "Logged out successfully"}, status=status.HTTP_205_RESET_CONTENT)
         except Exception as e:
@@ -141,31 +144,18 @@ class UserProfileAPIView(views.APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def put(self, request):
-        serializer = UserSerializer(request.user, data=request.data, partial=True)
+        # request.user may be the copy cached by CachedJWTAuthentication. UserSerializer.update
+        # saves every column, so write against a fresh row rather than a possibly stale one.
+        user = User.objects.get(pk=request.user.pk)
+        serializer = UserSerializer(user, data=request.data, partial=True)
         if serializer.is_valid():
             # Prevent updating email and phone number
             serializer.validated_data.pop('email', None)
             serializer.validated_data.pop('phone_number', None)
-            user = serializer.save()
-
-            # Handle address updates
-            addresses_data = request.data.get('addresses', [])
-            existing_addresses = {addr.id: addr for addr in user.addresses.all()}
-
-            for address_data in addresses_data:
-                address_id = address_data.get('id')
-                if address_id and address_id in existing_addresses:
-                    # Update existing address
-                    address = existing_addresses.pop(address_id)
-                    for attr, value in address_data.items():
-                        setattr(address, attr, value)
-                    address.save()
-                else:
-                    # Create new address
-                    Address.objects.create(user=user, **address_data)
-
-            # No need to delete any addresses as we're not handling explicit deletions here
-
+            # UserSerializer.update creates and updates the nested addresses.
+            # Addresses left out of the request are kept; deletions aren't handled here.
+            with transaction.atomic():
+                serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -177,30 +167,54 @@ class CustomPasswordResetConfirmView(APIView):
     def post(self, request, uidb64, token):
         try:
             uid = urlsafe_base64_decode(uidb64).decode()
-            user = get_user_model().objects.get(pk=uid)
-        except (TypeError, ValueError, OverflowError, get_user_model().DoesNotExist) as e:
+            # Columns used by the token hash, UserAttributeSimilarityValidator and set_password
+            user = User.objects.only(
+                'id', 'password', 'is_active', 'username', 'first_name', 'last_name', 'email'
+            ).get(pk=uid)
+        except (TypeError, ValueError, OverflowError, User.DoesNotExist) as e:
             return Response({"error": "Invalid link: " + str(e)}, status=400)
 
         if user is not None and custom_token_generator.check_token(user, token):
-            form = SetPasswordForm(user, request.data)
-            if form.is_valid():
-                form.save()
-                return Response({"message": "Password has been reset successfully"}, status=200)
-            return Response({"errors": form.errors}, status=400)
+            # Same checks and error shape as SetPasswordForm, without building a form
+            password1 = request.data.get('new_password1')
+            password2 = request.data.get('new_password2')
+            missing = {field: ["This field is required."] for field, value in
+                       (('new_password1', password1), ('new_password2', password2)) if not value}
+            if missing:
+                return Response({"errors": missing}, status=400)
+            # JSON bodies can carry numbers or lists; the validators need strings
+            invalid = {field: ["Not a valid string."] for field, value in
+                       (('new_password1', password1), ('new_password2', password2)) if not isinstance(value, str)}
+            if invalid:
+                return Response({"errors": invalid}, status=400)
+            if password1 != password2:
+                return Response({"errors": {"new_password2": ["The two password fields didn’t match."]}}, status=400)
+            try:
+                validate_password(password2, user)
+            except ValidationError as e:
+                return Response({"errors": {"new_password2": e.messages}}, status=400)
+            user.set_password(password1)
+            user.save(update_fields=['password'])
+            return Response({"message": "Password has been reset successfully"}, status=200)
 
         return Response({"error": "Invalid token or user"}, status=400)
     
 
-class AddressListCreateAPIView(generics.ListCreateAPIView):
-    permission_classes = [IsAuthenticated]
-    serializer_class = AddressSerializer
-
+class AddressQuerysetMixin:
+    """
+    Limits addresses to the requesting user's, or to ?user_id= for staff.
+    """
     def get_queryset(self):
         user_id = self.request.query_params.get('user_id')
         if self.request.user.is_staff and user_id:
             return Address.objects.filter(user_id=user_id)
         return Address.objects.filter(user=self.request.user)
 
+
+class AddressListCreateAPIView(AddressQuerysetMixin, generics.ListCreateAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = AddressSerializer
+
     def perform_create(self, serializer):
         user_id = self.request.data.get('user_id')
         if self.request.user.is_staff and user_id:
@@ -208,36 +222,25 @@ class AddressListCreateAPIView(generics.ListCreateAPIView):
         else:
             serializer.save(user=self.request.user)
 
-class AddressDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class AddressDetailAPIView(AddressQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = AddressSerializer
 
-    def get_queryset(self):
-        user_id = self.request.query_params.get('user_id')
-        if self.request.user.is_staff and user_id:
-            return Address.objects.filter(user_id=user_id)
-        return Address.objects.filter(user=self.request.user)
-
-    def get_object(self):
-        queryset = self.get_queryset()
-        filter_kwargs = {'pk': self.kwargs['pk']}
-        obj = generics.get_object_or_404(queryset, **filter_kwargs)
-        self.check_object_permissions(self.request, obj)
-        return obj
-
 class VerifyEmail(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, uidb64, token):
         try:
             uid = force_str(urlsafe_base64_decode(uidb64))
-            user = User.objects.get(pk=uid)
+            # The verification token hash only needs the pk and email
+            user = User.objects.only('id', 'email').get(pk=uid)
         except (TypeError, ValueError, OverflowError, User.DoesNotExist):
             user = None
 
         if user is not None and email_verification_token.check_token(user, token):
-            user.is_active = True
-            user.save()
+            # One UPDATE without re-saving the instance; evict the copy cached for JWT auth
+            User.objects.filter(pk=user.pk).update(is_active=True, is_email_verified=True)
+            cache.delete(user_cache_key(user.pk))
             return Response({'message': 'Email verified successfully!'}, status=status.HTTP_200_OK)
         else:
             return Response({'error': 'Invalid token or user ID'}, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
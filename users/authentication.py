@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+# Seconds an authenticated user is served from the cache before being reloaded
+USER_CACHE_TIMEOUT = 60
+
+
+def user_cache_key(user_id):
+    return f"jwtuser:{user_id}"
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the token's user instead of selecting it on every request.
+    Entries are evicted whenever the user is saved or deleted (see users.signals). Caching is
+    only enabled with settings.CACHE_JWT_USER, which requires a cache shared by all workers;
+    with a per-process cache an eviction would not reach the other workers.
+    The cached user is for authentication only: views that write to the user must reload it.
+    """
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not getattr(settings, 'CACHE_JWT_USER', False):
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # Inactive or missing users raise here and are never cached
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+        return user
@@ -3,14 +3,6 @@ from rest_framework import serializers
 from django.core.validators import RegexValidator, validate_email
 from rest_framework.validators import UniqueValidator
 from .models import Address
-from .tokens import email_verification_token
-from django.core.mail import send_mail
-from django.conf import settings
-from django.utils.http import urlsafe_base64_encode
-from django.utils.encoding import force_bytes
-from django.urls import reverse
-from django.template.loader import render_to_string
-from django.core.mail import EmailMultiAlternatives
 
 User = get_user_model()
 
@@ -56,44 +48,33 @@ class UserSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         addresses_data = validated_data.pop('addresses', [])
         user = User.objects.create_user(**validated_data)
-        for address_data in addresses_data:
-            Address.objects.create(user=user, **address_data)
+        if addresses_data:
+            Address.objects.bulk_create([Address(user=user, **address_data) for address_data in addresses_data])
         return user
 
     def update(self, instance, validated_data):
         addresses_data = validated_data.pop('addresses', None)
         instance = super().update(instance, validated_data)
         if addresses_data is not None:
-            existing_addresses = {addr.id: addr for addr in instance.addresses.all()}
+            # Only load the addresses this request actually updates
+            incoming_ids = [address_data['id'] for address_data in addresses_data if address_data.get('id')]
+            existing_addresses = instance.addresses.in_bulk(incoming_ids)
+            to_update, to_create, update_fields = [], [], set()
             for address_data in addresses_data:
-                address_id = address_data.get('id')
+                address_id = address_data.pop('id', None)
                 if address_id and address_id in existing_addresses:
                     # Update existing address
                     address = existing_addresses.pop(address_id)
                     for attr, value in address_data.items():
                         setattr(address, attr, value)
-                    address.save()
+                    update_fields.update(address_data)
+                    to_update.append(address)
                 else:
                     # Create new address
-                    Address.objects.create(user=instance, **address_data)
+                    to_create.append(Address(user=instance, **address_data))
+            # One UPDATE and one INSERT for the whole batch instead of a query per address
+            if to_update and update_fields:
+                Address.objects.bulk_update(to_update, fields=list(update_fields))
+            if to_create:
+                Address.objects.bulk_create(to_create)
         return instance
-
-
-    def send_verification_email(self, user):
-        token = email_verification_token.make_token(user)
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
-        verification_url = reverse('email-verify', kwargs={'uidb64': uid, 'token': token})
-        # Construct absolute URL using request
-        verification_link = f"http://127.0.0.1:8000{verification_url}"
-
-        # Load HTML content
-        html_content = render_to_string('email_verification.html', {'user': user, 'verification_link': verification_link})
-
-        email = EmailMultiAlternatives(
-            subject='Email Verification',
-            body=f'Please verify your email by clicking on the following link: {verification_link}',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email]
-        )
-        email.attach_alternative(html_content, "text/html")
-        email.send()
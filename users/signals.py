@@ -1,11 +1,28 @@
+import logging
+from functools import partial
+
 from django.core.mail import EmailMultiAlternatives
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django_rest_passwordreset.signals import reset_password_token_created
 from django.urls import reverse
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
+from .authentication import user_cache_key
+from .models import CustomUser
 from .tokens import custom_token_generator
 
+logger = logging.getLogger(__name__)
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def evict_cached_user(sender, instance, **kwargs):
+    # Drop the copy CachedJWTAuthentication keeps so the next request reloads it. Evicting only
+    # after commit stops a concurrent request from caching the old row before the change is visible.
+    transaction.on_commit(partial(cache.delete, user_cache_key(instance.pk)))
+
 
 @receiver(reset_password_token_created)
 def password_reset_token_created(sender, instance, reset_password_token, *args, **kwargs):
@@ -46,5 +63,5 @@ def password_reset_token_created(sender, instance, reset_password_token, *args,
     msg.attach_alternative(email_html_message, "text/html")
     try:
         msg.send()
-    except Exception as e:
-        print("Failed to send email:", e)
\ No newline at end of file
+    except Exception:
+        logger.exception("Failed to send password reset email to user %s", reset_password_token.user.pk)
\ No newline at end of file
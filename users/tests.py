@@ -3,9 +3,15 @@
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
+from unittest import mock
 from .models import CustomUser, Address
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.test import override_settings
+from django.core.cache import cache
+from django.core import mail
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from .tokens import custom_token_generator, email_verification_token
 
 
 class UserAccountTests(APITestCase):
@@ -93,6 +99,29 @@ class UserAccountTests(APITestCase):
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('access', response.data)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+
+    def test_user_login_non_string_password(self):
+        # Unknown and known logins fail the same way
+        for login in ('nobody', 'testuser'):
+            response = self.client.post(reverse('user-login'), {
+                'login': login,
+                'password': 123
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_user_login_query_count(self):
+        # One SELECT for the user, one UPDATE for last_login and one INSERT for the
+        # outstanding refresh token; no deferred-field reloads
+        with self.assertNumQueries(3):
+            response = self.client.post(reverse('user-login'), {
+                'login': 'testuser',
+                'password': 'password123'
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
     def test_user_login_with_phone_number(self):
@@ -155,6 +184,21 @@ class UserAccountTests(APITestCase):
                               f"Expected rate limit error but got {response.status_code}: {response.data}")
 
 
+    @override_settings(ENABLE_RATE_LIMIT=True)
+    def test_rate_limit_login_per_account(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = reverse('user-login')
+        data = {'login': 'testuser', 'password': 'wrongpassword'}
+
+        for i in range(5):
+            response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.post(url, data, format='json')
+        self.assertIn(response.status_code, [status.HTTP_403_FORBIDDEN, status.HTTP_429_TOO_MANY_REQUESTS])
+
+
     def test_user_logout(self):
         # Log in to get the access and refresh tokens
         login_response = self.client.post(reverse('user-login'), {
@@ -260,6 +304,151 @@ class UserAccountTests(APITestCase):
         self.assertEqual(self.user.first_name, 'UpdatedName')  # Ensure first name was updated
 
 
+    def test_update_profile_addresses(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(reverse('user-profile'), {
+            'addresses': [
+                {
+                    'id': self.address.id,
+                    'address_line1': 'Updated Address',
+                    'city': 'Test City',
+                    'state': 'Test State',
+                    'postal_code': '123456'
+                },
+                {
+                    'address_line1': 'New Address',
+                    'city': 'New City',
+                    'state': 'New State',
+                    'postal_code': '654321'
+                }
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        # The existing address is updated in place and the new one created once
+        self.assertEqual(self.user.addresses.count(), 2)
+        self.address.refresh_from_db()
+        self.assertEqual(self.address.address_line1, 'Updated Address')
+        self.assertTrue(self.user.addresses.filter(address_line1='New Address', city='New City').exists())
+
+
+    @override_settings(CACHE_JWT_USER=True)
+    def test_profile_reflects_user_changes_with_cached_authentication(self):
+        access = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access)
+        response = self.client.get(reverse('user-profile'))
+        self.assertEqual(response.data['first_name'], 'Test')
+
+        # Saving the user evicts the cached copy used for authentication once the change commits
+        self.user.first_name = 'Changed'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        response = self.client.get(reverse('user-profile'))
+        self.assertEqual(response.data['first_name'], 'Changed')
+
+
+    @override_settings(CACHE_JWT_USER=True)
+    def test_profile_update_does_not_write_back_cached_user(self):
+        access = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + access)
+        # Fills the authentication cache with a user that has no last_login yet
+        self.client.get(reverse('user-profile'))
+
+        # Login sets last_login with a queryset update, which doesn't evict the cache
+        response = self.client.post(reverse('user-login'), {'login': 'testuser', 'password': 'password123'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.put(reverse('user-profile'), {'first_name': 'Z'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Z')
+        self.assertIsNotNone(self.user.last_login)
+
+
+    def test_address_detail_limited_to_own_addresses(self):
+        other_user = CustomUser.objects.create_user(
+            username='otheruser',
+            email='otheruser@gmail.com',
+            password='password123',
+            phone_number='+919876543211',
+            birthdate='1990-01-01'
+        )
+        self.client.force_authenticate(user=other_user)
+        response = self.client.get(reverse('address-detail', args=[self.address.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse('address-detail', args=[self.address.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['address_line1'], 'Test Address')
+
+
+    def test_verify_email(self):
+        self.user.is_active = False
+        self.user.save()
+        uidb64 = urlsafe_base64_encode(force_bytes(self.user.pk))
+        token = email_verification_token.make_token(self.user)
+
+        response = self.client.get(reverse('email-verify', kwargs={'uidb64': uidb64, 'token': 'bad-token'}))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse('email-verify', kwargs={'uidb64': uidb64, 'token': token}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_active)
+        self.assertTrue(self.user.is_email_verified)
+
+
+    @override_settings(ENABLE_RATE_LIMIT=False)
+    def test_password_reset_email_failure_is_logged(self):
+        with mock.patch('users.signals.EmailMultiAlternatives.send', side_effect=ConnectionError), \
+                self.assertLogs('users.signals', level='ERROR') as logs:
+            response = self.client.post(reverse('password_reset:reset-password-request'), {'email': self.user.email})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Failed to send password reset email', logs.output[0])
+
+
+    def test_password_reset_confirm(self):
+        uidb64 = urlsafe_base64_encode(force_bytes(self.user.pk))
+        token = custom_token_generator.make_token(self.user)
+        url = reverse('password_reset_confirm', kwargs={'uidb64': uidb64, 'token': token})
+
+        response = self.client.post(url, {
+            'new_password1': 'Str0ngNewPassw0rd',
+            'new_password2': 'Different1Passw0rd'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('new_password2', response.data['errors'])
+
+        for value in (123456789, ['Str0ngNewPassw0rd']):
+            response = self.client.post(url, {
+                'new_password1': value,
+                'new_password2': value
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('new_password1', response.data['errors'])
+
+        response = self.client.post(url, {
+            'new_password1': 'Str0ngNewPassw0rd',
+            'new_password2': 'Str0ngNewPassw0rd'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Str0ngNewPassw0rd'))
+
+
+    @override_settings(ENABLE_RATE_LIMIT=False)
+    def test_registration_sends_verification_email_after_commit(self):
+        # Saving the user also registers cache evictions, so check the outbox rather than the callbacks
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('user-register'), self.sample_data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+            self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['newuser@example.com'])
+
+
     @override_settings(ENABLE_RATE_LIMIT=False)
     def test_user_registration_with_required_and_optional_addresses(self):
         url = reverse('user-register')